@@ -1,37 +1,133 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import itertools
 import json
 import re
+import time
+import urllib.error
 import urllib.request
-from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Tuple
 
+from .. import config
+
+try:  # optional fast path for the combinatorial search
+    import numpy as np
+except ImportError:
+    np = None
+
 URL = "https://f1fantasytools.com/team-calculator"
 
+_NEXT_F_RE = re.compile(r'self\.__next_f\.push\(\[1,"(.*?)"\]\)', re.DOTALL)
 
-def fetch(url: str) -> str:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (X11; Linux) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
-        },
-    )
-    with urllib.request.urlopen(req, timeout=60) as r:
-        return r.read().decode("utf-8", errors="ignore")
+_JS_ESCAPE_RE = re.compile(r"\\u([0-9a-fA-F]{4})|\\(.)", re.DOTALL)
+_JS_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+
+def _unescape_js(raw: str) -> str:
+    """Decode the escape set used in Next.js flight payload string literals.
+
+    Unlike the old utf-8/unicode_escape round-trip, this leaves non-ASCII
+    characters alone (unicode_escape reinterprets them as Latin-1) and avoids
+    allocating a full intermediate bytes buffer.
+    """
+
+    def repl(m: "re.Match[str]") -> str:
+        if m.group(1) is not None:
+            return chr(int(m.group(1), 16))
+        c = m.group(2)
+        return _JS_SIMPLE_ESCAPES.get(c, c)
+
+    return _JS_ESCAPE_RE.sub(repl, raw)
+
+
+_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
+    # The team-calculator HTML is multi-MB; gzip cuts the transfer ~5x.
+    "Accept-Encoding": "gzip",
+}
+
+_OPENER = urllib.request.build_opener()
+
+
+def _cache_paths(url: str) -> tuple[Path, Path]:
+    h = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    cache_dir = config.STATE_DIR / "cache"
+    return cache_dir / f"{h}.html", cache_dir / f"{h}.meta.json"
+
+
+def fetch(url: str, *, max_age_s: float = 0.0) -> str:
+    """Fetch `url`, caching the body under state/cache keyed by URL.
+
+    With a cached copy we revalidate via If-None-Match/If-Modified-Since, so a
+    304 skips the multi-MB transfer; `max_age_s` > 0 additionally skips the
+    request entirely while the copy is younger than that.
+    """
+    body_path, meta_path = _cache_paths(url)
+    meta = None
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            meta = None
+
+    if meta and max_age_s > 0 and time.time() - float(meta.get("ts") or 0) < max_age_s:
+        return body_path.read_text(encoding="utf-8")
+
+    headers = dict(_FETCH_HEADERS)
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with _OPENER.open(req, timeout=60) as r:
+            raw = r.read()
+            if (r.headers.get("Content-Encoding") or "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and meta:
+            meta["ts"] = time.time()
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            return body_path.read_text(encoding="utf-8")
+        raise
+
+    html = raw.decode("utf-8", errors="ignore")
+    try:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_text(html, encoding="utf-8")
+        meta_path.write_text(
+            json.dumps({"url": url, "ts": time.time(), "etag": etag, "last_modified": last_modified}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass  # cache is best-effort; the fetched body is still returned
+    return html
 
 
 def extract_next_payload(html: str) -> str:
     """Extract and decode the largest self.__next_f.push([1,"..."]) string."""
-    chunks = re.findall(r'self\.__next_f\.push\(\[1,"(.*?)"\]\)', html, flags=re.DOTALL)
-    if not chunks:
+    # Track the longest match span instead of materializing every captured
+    # payload (findall) just to take the max; only the winner gets sliced.
+    best_span: tuple[int, int] | None = None
+    best_len = 0
+    for m in _NEXT_F_RE.finditer(html):
+        s, e = m.span(1)
+        if e - s > best_len:
+            best_len = e - s
+            best_span = (s, e)
+    if best_span is None:
         raise RuntimeError("Could not find self.__next_f.push payload in HTML")
-    raw = max(chunks, key=len)
-    try:
-        decoded = raw.encode("utf-8").decode("unicode_escape")
-    except Exception as e:
-        raise RuntimeError("Failed to decode __next_f payload: %s" % (e,))
-    return decoded
+    return _unescape_js(html[best_span[0] : best_span[1]])
+
+
+_JSON_DECODER = json.JSONDecoder()
 
 
 def extract_json_object_from_payload(payload: str) -> dict:
@@ -40,25 +136,180 @@ def extract_json_object_from_payload(payload: str) -> dict:
     if start == -1:
         raise RuntimeError("Could not locate JSON object start in payload")
 
-    depth = 0
-    for i in range(start, len(payload)):
-        c = payload[i]
-        if c == "{":
-            depth += 1
-        elif c == "}":
-            depth -= 1
-            if depth == 0:
-                obj_str = payload[start : i + 1]
-                return json.loads(obj_str)
+    # raw_decode parses the balanced object in C and stops at its end,
+    # replacing the old per-character brace counter and the substring copy.
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(payload, start)
+    except json.JSONDecodeError as e:
+        raise RuntimeError("Failed to parse JSON object from payload: %s" % (e,))
+    return obj
+
+
+_BestTeam = Tuple[float, float, Tuple[str, str], Tuple[str, ...], str]
+
+
+def _search_python(
+    max_budget: float,
+    d_codes: List[str],
+    d_prices: List[float],
+    d_pts: List[float],
+    c_codes: List[str],
+    c_prices: List[float],
+    c_pts: List[float],
+) -> _BestTeam | None:
+    """Branch-and-bound over driver 5-subsets per constructor pair.
+
+    Drivers are sorted by pts desc, so the best k remaining picks from index i
+    are simply drivers[i:i+k]; together with the k-cheapest suffix costs this
+    gives tight upper/lower bounds to prune dominated or infeasible partial
+    selections early. The DFS allocates nothing per node (one shared index
+    buffer instead of partial tuples).
+    """
+    order = sorted(range(len(d_codes)), key=d_pts.__getitem__, reverse=True)
+    codes = [d_codes[i] for i in order]
+    prices = [d_prices[i] for i in order]
+    pts = [d_pts[i] for i in order]
+    n = len(codes)
+
+    pts_prefix = [0.0]
+    for p in pts:
+        pts_prefix.append(pts_prefix[-1] + p)
+
+    def top_pts(i: int, k: int) -> float:
+        """Sum of the k highest remaining pts at suffix drivers[i:]."""
+        return pts_prefix[min(i + k, n)] - pts_prefix[i]
+
+    # min_cost[i][k] = cost of the k cheapest drivers among drivers[i:].
+    min_cost = [[0.0] * 6 for _ in range(n + 1)]
+    for i in range(n + 1):
+        acc = 0.0
+        for k, price in enumerate(sorted(prices[i:])[:5], start=1):
+            acc += price
+            min_cost[i][k] = acc
+
+    best: _BestTeam | None = None
+    max_boost_pts = pts[0] if pts else 0.0
+    chosen_idx = [0] * 5
+
+    # Visit constructor pairs best-points-first: the pair upper bound is
+    # c_points plus constants, so a strong incumbent lands on the first pair
+    # (whose DFS take-branch reaches a greedy feasible leaf immediately) and
+    # the bound check below then rejects most later pairs outright.
+    pairs = sorted(
+        itertools.combinations(range(len(c_codes)), 2),
+        key=lambda ab: c_pts[ab[0]] + c_pts[ab[1]],
+        reverse=True,
+    )
+
+    for a, b in pairs:
+        c_cost = c_prices[a] + c_prices[b]
+        c_points = c_pts[a] + c_pts[b]
+        if c_cost >= max_budget:
+            continue
+        if best is not None and c_points + top_pts(0, 5) + max_boost_pts < best[0] - 1e-9:
+            continue
+
+        driver_budget = max_budget - c_cost
+        cons_codes = tuple(sorted([c_codes[a], c_codes[b]]))
+
+        def search(idx: int, k: int, cost: float, pts_sum: float) -> None:
+            nonlocal best
+            if k == 5:
+                if cost > driver_budget + 1e-9:
+                    return
+                total_cost = c_cost + cost
+                # pts-sorted drivers mean the first pick is always the boost.
+                points = c_points + pts_sum + pts[chosen_idx[0]]
+                if best is None or points > best[0] + 1e-9 or (
+                    abs(points - best[0]) < 1e-9 and total_cost < best[1] - 1e-9
+                ):
+                    best = (
+                        points,
+                        total_cost,
+                        cons_codes,
+                        tuple(sorted(codes[j] for j in chosen_idx)),
+                        codes[chosen_idx[0]],
+                    )
+                return
+
+            need = 5 - k
+            if n - idx < need:
+                return
+            if cost + min_cost[idx][need] > driver_budget + 1e-9:
+                return
+            boost_ub = pts[chosen_idx[0]] if k else pts[idx]
+            if best is not None and c_points + pts_sum + top_pts(idx, need) + boost_ub < best[0] - 1e-9:
+                return
+
+            chosen_idx[k] = idx
+            search(idx + 1, k + 1, cost + prices[idx], pts_sum + pts[idx])
+            search(idx + 1, k, cost, pts_sum)
+
+        search(0, 0, 0.0, 0.0)
+
+    return best
+
+
+def _search_numpy(
+    max_budget: float,
+    d_codes: List[str],
+    d_prices: List[float],
+    d_pts: List[float],
+    c_codes: List[str],
+    c_prices: List[float],
+    c_pts: List[float],
+) -> _BestTeam | None:
+    """Vectorized search: enumerate driver 5-combos once as an index matrix.
+
+    Per-combination cost/pts/boost become C-level reductions over the matrix,
+    then each constructor pair is a masked argmax instead of 26k Python loop
+    bodies.
+    """
+    n = len(d_codes)
+    prices = np.asarray(d_prices, dtype=np.float64)
+    points = np.asarray(d_pts, dtype=np.float64)
+
+    idx = np.array(list(itertools.combinations(range(n), 5)), dtype=np.int32)
+    combo_pts = points[idx]
+    d_cost = prices[idx].sum(axis=1)
+    d_pts = combo_pts.sum(axis=1)
+    boost_pos = combo_pts.argmax(axis=1)
+    boost_gain = combo_pts.max(axis=1)
+
+    best: _BestTeam | None = None
+
+    for a, b in itertools.combinations(range(len(c_codes)), 2):
+        c_cost = c_prices[a] + c_prices[b]
+        c_points = c_pts[a] + c_pts[b]
+        if c_cost >= max_budget:
+            continue
+
+        score = np.where(d_cost <= max_budget - c_cost + 1e-9, c_points + d_pts + boost_gain, -np.inf)
+        top = score.max()
+        if top == -np.inf:
+            continue
+        if best is not None and top < best[0] - 1e-9:
+            continue
 
-    raise RuntimeError("Unbalanced braces while extracting JSON object")
+        # Among score ties, prefer the cheapest combo (matches the scalar search).
+        tied = np.nonzero(score >= top - 1e-9)[0]
+        i = int(tied[d_cost[tied].argmin()])
 
+        pts_i = float(score[i])
+        total_cost = float(c_cost + d_cost[i])
+        if best is None or pts_i > best[0] + 1e-9 or (
+            abs(pts_i - best[0]) < 1e-9 and total_cost < best[1] - 1e-9
+        ):
+            combo = idx[i]
+            best = (
+                pts_i,
+                total_cost,
+                tuple(sorted([c_codes[a], c_codes[b]])),
+                tuple(sorted(d_codes[j] for j in combo)),
+                d_codes[combo[boost_pos[i]]],
+            )
 
-@dataclass(frozen=True)
-class Pick:
-    code: str
-    price: float
-    pts: float
+    return best
 
 
 def compute_optimal(max_budget: float, data: dict) -> dict:
@@ -82,46 +333,32 @@ def compute_optimal(max_budget: float, data: dict) -> dict:
         if c.get("type") == "constructor" and c.get("abbreviation"):
             con_price[str(c["abbreviation"])] = float(c["price"])
 
-    drivers: List[Pick] = []
-    for drv_id, pts in drv_pts.items():
+    # Structure-of-arrays: the search kernels only touch price/pts floats,
+    # so parallel lists beat a per-pick object for locality and lookup cost.
+    d_codes: List[str] = []
+    d_prices: List[float] = []
+    d_points: List[float] = []
+    for drv_id, p in drv_pts.items():
         if drv_id in drv_meta:
             abbr, price = drv_meta[drv_id]
-            drivers.append(Pick(code=abbr, price=price, pts=float(pts)))
-
-    constructors: List[Pick] = [
-        Pick(code=k, price=con_price[k], pts=float(v)) for k, v in con_pts.items() if k in con_price
-    ]
-
-    if not drivers or not constructors:
+            d_codes.append(abbr)
+            d_prices.append(price)
+            d_points.append(float(p))
+
+    c_codes: List[str] = []
+    c_prices: List[float] = []
+    c_points: List[float] = []
+    for k, v in con_pts.items():
+        if k in con_price:
+            c_codes.append(k)
+            c_prices.append(con_price[k])
+            c_points.append(float(v))
+
+    if not d_codes or not c_codes:
         raise RuntimeError("Could not build drivers/constructors pick lists")
 
-    best: Tuple[float, float, Tuple[str, str], Tuple[str, ...], str] | None = None
-
-    for c1, c2 in itertools.combinations(constructors, 2):
-        c_cost = c1.price + c2.price
-        c_points = c1.pts + c2.pts
-        if c_cost >= max_budget:
-            continue
-
-        for ds in itertools.combinations(drivers, 5):
-            d_cost = sum(d.price for d in ds)
-            total_cost = c_cost + d_cost
-            if total_cost > max_budget + 1e-9:
-                continue
-
-            base_points = c_points + sum(d.pts for d in ds)
-            for boost in ds:
-                points = base_points + boost.pts
-                if best is None or points > best[0] + 1e-9 or (
-                    abs(points - best[0]) < 1e-9 and total_cost < best[1] - 1e-9
-                ):
-                    best = (
-                        points,
-                        total_cost,
-                        tuple(sorted([c1.code, c2.code])),
-                        tuple(sorted([d.code for d in ds])),
-                        boost.code,
-                    )
+    search = _search_numpy if np is not None and len(d_codes) >= 5 else _search_python
+    best = search(max_budget, d_codes, d_prices, d_points, c_codes, c_prices, c_points)
 
     if best is None:
         raise RuntimeError("No feasible team found under budget")
@@ -143,18 +380,42 @@ def compute_optimal(max_budget: float, data: dict) -> dict:
     }
 
 
-def load_optimal_and_prices(max_budget: float, url: str | None = None) -> tuple[dict, dict]:
-    """Return (optimal, price_maps).
+def _payload_data(html: str) -> dict:
+    """Extract the embedded data dict, caching the parse keyed by body digest.
 
-    price_maps:
-      {
-        "drivers": {"LEC": 22.8, ...},
-        "constructors": {"MCL": 28.9, ...}
-      }
+    The page only changes between raceweeks, so a 304/TTL cache hit in
+    ``fetch`` usually hands back byte-identical HTML; hashing it is far
+    cheaper than re-running the payload regex + unescape + JSON parse.
+    """
+    digest = hashlib.sha1(html.encode("utf-8")).hexdigest()
+    cache_path = config.STATE_DIR / "cache" / "f1ft_data.json"
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cached.get("digest") == digest:
+            return cached["data"]
+    except Exception:
+        pass
+
+    data = extract_json_object_from_payload(extract_next_payload(html))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"digest": digest, "data": data}), encoding="utf-8")
+    except OSError:
+        pass  # cache is best-effort, same as the HTML body cache
+    return data
+
+
+def load_data_and_prices(
+    url: str | None = None, *, max_age_s: float = 300.0
+) -> tuple[dict, dict]:
+    """Return (data, price_maps) — the budget-independent half of the load.
+
+    Callers that learn the budget concurrently (e.g. while a browser scrape
+    runs) can start this first and call ``compute_optimal`` once the cap is
+    known.
     """
-    html = fetch(url or URL)
-    payload = extract_next_payload(html)
-    data = extract_json_object_from_payload(payload)
+    html = fetch(url or URL, max_age_s=max_age_s)
+    data = _payload_data(html)
 
     drv_prices: dict[str, float] = {}
     for d in (data.get("drivers") or []):
@@ -166,5 +427,19 @@ def load_optimal_and_prices(max_budget: float, url: str | None = None) -> tuple[
         if c.get("type") == "constructor" and c.get("abbreviation") and c.get("price") is not None:
             con_prices[str(c["abbreviation"])] = float(c["price"])
 
-    optimal = compute_optimal(max_budget, data)
-    return optimal, {"drivers": drv_prices, "constructors": con_prices}
+    return data, {"drivers": drv_prices, "constructors": con_prices}
+
+
+def load_optimal_and_prices(
+    max_budget: float, url: str | None = None, *, max_age_s: float = 300.0
+) -> tuple[dict, dict]:
+    """Return (optimal, price_maps).
+
+    price_maps:
+      {
+        "drivers": {"LEC": 22.8, ...},
+        "constructors": {"MCL": 28.9, ...}
+      }
+    """
+    data, price_maps = load_data_and_prices(url, max_age_s=max_age_s)
+    return compute_optimal(max_budget, data), price_maps
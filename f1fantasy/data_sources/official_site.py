@@ -2,77 +2,90 @@ from __future__ import annotations
 
 import re
 
-from playwright.sync_api import sync_playwright, TimeoutError as PwTimeout
+from playwright.sync_api import BrowserContext, TimeoutError as PwTimeout
 
 from .. import config
 from ..io.artifacts import utcstamp
 from ..models import BudgetSnapshot, TransferStatus
-from ..site.browser import launch_persistent_context
-
-
-def _parse_money_millions(text: str) -> float | None:
-    if not text:
-        return None
-
-    m = re.search(r"\$\s*([0-9]+(?:\.[0-9]+)?)\s*M", text, flags=re.I)
-    if m:
-        return float(m.group(1))
-
-    m = re.search(r"([0-9]+(?:\.[0-9]+)?)\s*million", text, flags=re.I)
-    if m:
-        return float(m.group(1))
-
-    return None
-
-
-def scrape_budget_snapshot(*, team_id: int, profile_dir: str, headful: bool) -> BudgetSnapshot:
+from ..site.browser import browser_context
+
+# Extracts both the remaining Cost Cap and the selected-card prices in one
+# browser-side pass, so a scrape costs a single CDP round-trip instead of
+# inner_text + page.content() + Python-side regexes.
+_BUDGET_EXTRACT_JS = r"""
+() => {
+  const moneyDollar = /\$\s*([0-9]+(?:\.[0-9]+)?)\s*M/i;
+  const moneyWord = /([0-9]+(?:\.[0-9]+)?)\s*million/i;
+  const parseMoney = (txt) => {
+    if (!txt) return null;
+    let m = txt.match(moneyDollar);
+    if (m) return parseFloat(m[1]);
+    m = txt.match(moneyWord);
+    if (m) return parseFloat(m[1]);
+    return null;
+  };
+
+  let remaining = null;
+  const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+  let node;
+  while ((node = walker.nextNode())) {
+    if (!(node.nodeValue || '').includes('Cost Cap')) continue;
+    const host = node.parentElement;
+    const section = host ? (host.closest('section') || host) : null;
+    remaining = parseMoney(section ? section.textContent : '');
+    if (remaining !== null) break;
+  }
+
+  // One regex pass over the container's textContent; unlike innerText it
+  // doesn't force a layout pass, and unlike per-node class/data-price
+  // queries it can't double-count a price whose wrapper and child both
+  // match (or concatenate the digits of several nested prices).
+  const cont = document.querySelector('div.si-formation__container') || document.body;
+  const used = [...(cont.textContent || '').matchAll(/\$\s*([0-9]+(?:\.[0-9]+)?)\s*M/gi)]
+    .map(m => parseFloat(m[1]))
+    .filter(Number.isFinite);
+
+  return {remaining_m: remaining, used_list: used};
+}
+"""
+
+
+def scrape_budget_snapshot(
+    *, team_id: int, profile_dir: str, headful: bool, ctx: BrowserContext | None = None
+) -> BudgetSnapshot:
     """Scrape remaining budget and infer total cap from the official team page.
 
     cap ≈ remaining + sum(selected driver/constructor prices)
 
+    Pass an existing ``ctx`` to reuse an already-launched browser; otherwise a
+    context is launched for just this scrape.
+
     Returns BudgetSnapshot(remaining_m, used_m, cap_m)
     """
 
+    if ctx is not None:
+        return _scrape_budget_snapshot(ctx, team_id)
+    with browser_context(profile_dir=profile_dir, headful=headful) as own:
+        return _scrape_budget_snapshot(own, team_id)
+
+
+def _scrape_budget_snapshot(ctx: BrowserContext, team_id: int) -> BudgetSnapshot:
     url = config.FANTASY_TEAM_URL.format(team_id=team_id)
-    with sync_playwright() as p:
-        ctx = launch_persistent_context(playwright=p, profile_dir=profile_dir, headful=headful)
-        page = ctx.new_page()
-        page.goto(url, wait_until="domcontentloaded")
+    page = ctx.new_page()
+    try:
+        # commit returns as soon as navigation starts; the selector wait below
+        # is what actually gates on the budget widget rendering.
+        page.goto(url, wait_until="commit")
         try:
-            page.wait_for_selector('text=Cost Cap', timeout=60000)
+            page.wait_for_selector('text=Cost Cap', timeout=15000)
         except PwTimeout:
-            ctx.close()
             raise RuntimeError(f"Could not load team page / budget widget. Are we logged in? URL={page.url}")
 
-        remaining = None
-        try:
-            txt = page.locator("text=Cost Cap").first.locator("xpath=ancestor::section[1]").inner_text()
-            remaining = _parse_money_millions(txt)
-        except Exception:
-            remaining = None
-
-        if remaining is None:
-            html = page.content()
-            m = re.search(
-                r"Cost\s*Cap:\s*</span><em>\$\s*([0-9]+(?:\.[0-9]+)?)\s*M",
-                html,
-                flags=re.I,
-            )
-            if m:
-                remaining = float(m.group(1))
-
-        selected_sum = page.evaluate(
-            r"""() => {
-              const cont = document.querySelector('div.si-formation__container') || document.body;
-              const txt = cont.innerText || '';
-              const matches = [...txt.matchAll(/\$\s*([0-9]+(?:\.[0-9]+)?)\s*M/gi)];
-              const nums = matches.map(m => parseFloat(m[1])).filter(n => Number.isFinite(n));
-              return nums;
-            }"""
-        )
-        used = float(sum(selected_sum or []))
-
-        ctx.close()
+        extracted = page.evaluate(_BUDGET_EXTRACT_JS) or {}
+        remaining = extracted.get("remaining_m")
+        used = float(sum(extracted.get("used_list") or []))
+    finally:
+        page.close()
 
     if remaining is None:
         raise RuntimeError("Could not parse remaining Cost Cap from page")
@@ -104,20 +117,30 @@ def _parse_transfer_status_text(txt: str) -> tuple[int | None, int | None]:
     return free, penalty
 
 
-def scrape_transfer_status(*, team_id: int, profile_dir: str, headful: bool) -> TransferStatus:
-    """Scrape current transfer limits from the official team page."""
+def scrape_transfer_status(
+    *, team_id: int, profile_dir: str, headful: bool, ctx: BrowserContext | None = None
+) -> TransferStatus:
+    """Scrape current transfer limits from the official team page.
+
+    Pass an existing ``ctx`` to reuse an already-launched browser.
+    """
+
+    if ctx is not None:
+        return _scrape_transfer_status(ctx, team_id)
+    with browser_context(profile_dir=profile_dir, headful=headful) as own:
+        return _scrape_transfer_status(own, team_id)
+
 
+def _scrape_transfer_status(ctx: BrowserContext, team_id: int) -> TransferStatus:
     url = config.FANTASY_TEAM_URL.format(team_id=team_id)
-    with sync_playwright() as p:
-        ctx = launch_persistent_context(playwright=p, profile_dir=profile_dir, headful=headful)
-        page = ctx.new_page()
-        page.goto(url, wait_until="domcontentloaded")
+    page = ctx.new_page()
+    try:
+        page.goto(url, wait_until="commit")
 
         # Wait for core team-builder container to exist.
         try:
-            page.wait_for_selector('div.si-cmo__container, text=Cost Cap', timeout=60000)
+            page.wait_for_selector('div.si-cmo__container, text=Cost Cap', timeout=15000)
         except PwTimeout:
-            ctx.close()
             raise RuntimeError(f"Could not load team page. Are we logged in? URL={page.url}")
 
         txt = page.evaluate(
@@ -126,7 +149,8 @@ def scrape_transfer_status(*, team_id: int, profile_dir: str, headful: bool) ->
               return root.innerText || '';
             }"""
         )
-        ctx.close()
+    finally:
+        page.close()
 
     free, penalty = _parse_transfer_status_text(txt)
     if free is None:
@@ -2,12 +2,32 @@ from __future__ import annotations
 
 import datetime as _dt
 import json
-import re
+import string
+import time
 from pathlib import Path
 from typing import Any
 
 from .. import config
 
+try:  # optional C-speed JSON for the state/artifact files
+    import orjson
+except ImportError:
+    orjson = None
+
+class _SafeTable(dict):
+    """Translate table mapping any codepoint outside the safe set to a marker.
+
+    The marker (NUL never appears in names) lets safe_filename collapse runs
+    of replaced characters without touching literal underscores, which are
+    themselves in the safe set.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        return "\x00"
+
+
+_SAFE_TABLE = _SafeTable({ord(c): c for c in string.ascii_letters + string.digits + "._-"})
+
 
 def utcstamp() -> str:
     # timezone-aware UTC timestamp (avoids datetime.utcnow() deprecation warnings)
@@ -15,26 +35,63 @@ def utcstamp() -> str:
 
 
 def safe_filename(s: str) -> str:
-    s = re.sub(r"[^A-Za-z0-9._-]+", "_", s or "")
+    # translate() marks each unsafe char; the join collapses marker runs to a
+    # single "_", matching the old [^A-Za-z0-9._-]+ regex behavior exactly.
+    s = "_".join(p for p in (s or "").translate(_SAFE_TABLE).split("\x00") if p)
     return s.strip("_") or "file"
 
 
+def dumps_pretty(obj: Any) -> str:
+    """Indented, key-sorted JSON text (the CLI/report format), orjson-fast."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, indent=2, sort_keys=True)
+
+
 def read_json(path: Path, default: Any = None) -> Any:
     if not path.exists():
         return default
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def write_json(path: Path, obj: Any) -> None:
+def write_json(path: Path, obj: Any, *, sort_keys: bool = True) -> None:
+    # sort_keys=True keeps durable state/history files diff-stable; transient
+    # per-run artifacts can pass sort_keys=False to skip the recursive sort.
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, sort_keys=True)
-        f.write("\n")
+    if orjson is not None:
+        opts = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        if sort_keys:
+            opts |= orjson.OPT_SORT_KEYS
+        tmp.write_bytes(orjson.dumps(obj, option=opts))
+    else:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, sort_keys=sort_keys)
+            f.write("\n")
     tmp.replace(path)
 
 
+def cached_json(path: Path, ttl_s: float, producer, *, force: bool = False) -> Any:
+    """Return ``path``'s JSON while it is younger than ``ttl_s`` seconds.
+
+    Otherwise call ``producer()``, persist its result to ``path`` and return
+    it. The freshness check is a single stat(), so callers can wrap heavy
+    scrape/fetch work without paying for it on every invocation.
+    """
+    if not force:
+        try:
+            if time.time() - path.stat().st_mtime < ttl_s:
+                return read_json(path)
+        except OSError:
+            pass
+    obj = producer()
+    write_json(path, obj)
+    return obj
+
+
 def ensure_state_dirs() -> None:
     for d in (config.STATE_DIR, config.HISTORY_DIR, config.ARTIFACTS_DIR):
         d.mkdir(parents=True, exist_ok=True)
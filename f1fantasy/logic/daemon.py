@@ -0,0 +1,135 @@
+"""Keep one browser alive across CLI invocations.
+
+Chromium cold start (1-2s) dominates a cron-style "run every few minutes"
+workload. ``serve`` opens the persistent context once and accepts run jobs
+over a Unix socket; the CLI submits through ``submit_job`` instead of
+launching its own browser. Jobs run sequentially on the daemon's thread,
+which is exactly what the sync Playwright API requires anyway.
+
+Protocol: one JSON object per connection, newline-terminated, answered with
+one JSON reply line ``{"ok": bool, "result"|"error": ...}``.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from pathlib import Path
+from typing import Any
+
+from .. import config
+from ..site.browser import browser_context
+
+DEFAULT_SOCKET_PATH = config.STATE_DIR / "daemon.sock"
+
+
+def _recv_line(conn: socket.socket) -> bytes:
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    return b"".join(chunks)
+
+
+def serve(*, profile_dir: str, headful: bool, socket_path: Path | None = None) -> None:
+    """Run jobs over ``socket_path`` until a shutdown job arrives.
+
+    The browser context is launched once up front; every job reuses it via
+    the orchestrator's ``ctx`` hook, so per-job cost is just the sync itself.
+    """
+    from .orchestrator import run_end_to_end  # playwright import stays lazy
+
+    sock_path = Path(socket_path or DEFAULT_SOCKET_PATH)
+    sock_path.parent.mkdir(parents=True, exist_ok=True)
+    sock_path.unlink(missing_ok=True)
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        srv.bind(str(sock_path))
+        srv.listen(1)
+        with browser_context(profile_dir=profile_dir, headful=headful) as ctx:
+            while True:
+                conn, _ = srv.accept()
+                shutdown = False
+                # A malformed request, a client that hangs mid-send, or one
+                # that disconnects before reading its reply must not take the
+                # daemon (and its browser) down with it.
+                with conn:
+                    try:
+                        conn.settimeout(30.0)
+                        raw = _recv_line(conn)
+                        if not raw.strip():
+                            continue
+                        job = json.loads(raw)
+                        cmd = job.get("cmd")
+                        if cmd == "shutdown":
+                            shutdown = True
+                            reply: dict[str, Any] = {"ok": True}
+                        elif cmd == "ping":
+                            reply = {"ok": True}
+                        else:
+                            try:
+                                if cmd != "run":
+                                    raise RuntimeError(f"Unknown daemon command: {cmd!r}")
+                                bundle = run_end_to_end(
+                                    team_id=int(job["team_id"]),
+                                    budget=job.get("budget", "auto"),
+                                    expected_team_name=job.get("expected_team_name"),
+                                    ideal_out=Path(job.get("ideal_out") or (config.BASE_DIR / "ideal_team.json")),
+                                    profile_dir=profile_dir,
+                                    headful=headful,
+                                    apply=bool(job.get("apply", False)),
+                                    force=bool(job.get("force", False)),
+                                    url=job.get("url"),
+                                    boost_driver_override=job.get("boost_driver_override"),
+                                    refresh=bool(job.get("refresh", False)),
+                                    ctx=ctx,
+                                )
+                                reply = {"ok": True, "result": bundle}
+                            # SystemExit included: the orchestrator raises it
+                            # for bad parameters (e.g. boost_driver_override),
+                            # and a job must never take the daemon down.
+                            except (Exception, SystemExit) as e:
+                                reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                        conn.sendall(json.dumps(reply).encode() + b"\n")
+                    except Exception:
+                        pass  # broken client; drop the connection and keep serving
+                if shutdown:
+                    return
+    finally:
+        srv.close()
+        sock_path.unlink(missing_ok=True)
+
+
+def submit_job(job: dict, *, socket_path: Path | None = None, timeout_s: float = 600.0) -> dict:
+    """Send one job to a running daemon and return its reply payload.
+
+    Raises RuntimeError if the daemon is not up or the job failed.
+    """
+    sock_path = Path(socket_path or DEFAULT_SOCKET_PATH)
+    cli = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    cli.settimeout(timeout_s)
+    try:
+        try:
+            cli.connect(str(sock_path))
+        except OSError as e:
+            raise RuntimeError(
+                f"Daemon not reachable at {sock_path} ({e}). Start it with: f1_fantasy daemon"
+            ) from None
+        cli.sendall(json.dumps(job).encode() + b"\n")
+        cli.shutdown(socket.SHUT_WR)
+        try:
+            raw = _recv_line(cli)
+        except OSError:  # daemon died mid-exchange (connection reset)
+            raw = b""
+    finally:
+        cli.close()
+    if not raw.strip():
+        raise RuntimeError("Daemon closed the connection without replying")
+    reply = json.loads(raw)
+    if not reply.get("ok"):
+        raise RuntimeError(f"Daemon job failed: {reply.get('error')}")
+    return reply.get("result") or {}
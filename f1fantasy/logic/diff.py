@@ -1,36 +1,62 @@
 from __future__ import annotations
 
+import functools
 import re
 
+_WS_RE = re.compile(r"\s+")
 
+
+@functools.lru_cache(maxsize=256)
 def normalize_name(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip()).lower()
+    # The same ~17 roster names are normalized over and over per run.
+    return _WS_RE.sub(" ", (s or "").strip()).lower()
 
 
 def as_set(names: list[str] | None) -> set[str]:
     return {normalize_name(n) for n in (names or [])}
 
 
-def compute_diff(current_state: dict, ideal: dict) -> dict:
-    cur_dr = current_state.get("drivers", [])
-    cur_con = current_state.get("constructors", [])
-    cur_boost = current_state.get("boost_driver")
-
-    ideal_dr = ideal.get("drivers", [])
-    ideal_con = ideal.get("constructors", [])
-    ideal_boost = ideal.get("boost_driver")
-
-    cur_dr_set = as_set(cur_dr)
-    ideal_dr_set = as_set(ideal_dr)
-
-    cur_con_set = as_set(cur_con)
-    ideal_con_set = as_set(ideal_con)
+def _state_key(state: dict) -> tuple:
+    return (
+        tuple(state.get("drivers") or ()),
+        tuple(state.get("constructors") or ()),
+        state.get("boost_driver"),
+    )
 
-    drivers_remove = [d for d in cur_dr if normalize_name(d) not in ideal_dr_set]
-    drivers_add = [d for d in ideal_dr if normalize_name(d) not in cur_dr_set]
 
-    constructors_remove = [c for c in cur_con if normalize_name(c) not in ideal_con_set]
-    constructors_add = [c for c in ideal_con if normalize_name(c) not in cur_con_set]
+def compute_diff(current_state: dict, ideal: dict) -> dict:
+    # A sync diffs the same pair several times (planning, policy decision,
+    # post-apply verify); memoize on the name tuples and hand callers a copy
+    # so the cached entry can't be mutated through a returned reference.
+    # The list values are copied too — a plain dict() would leave them
+    # aliased to the cache.
+    cached = _compute_diff_cached(_state_key(current_state), _state_key(ideal))
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in cached.items()}
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_diff_cached(cur_key: tuple, ideal_key: tuple) -> dict:
+    cur_dr, cur_con, cur_boost = cur_key
+    ideal_dr, ideal_con, ideal_boost = ideal_key
+
+    # Normalize each name exactly once; the filters below reuse the cached
+    # forms instead of re-running normalize_name per membership check.
+    cur_dr_norm = [normalize_name(n) for n in cur_dr]
+    ideal_dr_norm = [normalize_name(n) for n in ideal_dr]
+    cur_con_norm = [normalize_name(n) for n in cur_con]
+    ideal_con_norm = [normalize_name(n) for n in ideal_con]
+
+    cur_dr_set = set(cur_dr_norm)
+    ideal_dr_set = set(ideal_dr_norm)
+
+    cur_con_set = set(cur_con_norm)
+    ideal_con_set = set(ideal_con_norm)
+
+    drivers_remove = [d for d, k in zip(cur_dr, cur_dr_norm) if k not in ideal_dr_set]
+    drivers_add = [d for d, k in zip(ideal_dr, ideal_dr_norm) if k not in cur_dr_set]
+
+    constructors_remove = [c for c, k in zip(cur_con, cur_con_norm) if k not in ideal_con_set]
+    constructors_add = [c for c, k in zip(ideal_con, ideal_con_norm) if k not in cur_con_set]
 
     boost_change = (ideal_boost is not None) and (normalize_name(cur_boost) != normalize_name(ideal_boost))
 
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
 from typing import Any
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import BrowserContext
 
 from .. import config
-from ..data_sources.f1fantasytools import load_optimal_and_prices
+from ..data_sources.f1fantasytools import compute_optimal, load_data_and_prices
 from ..data_sources.official_site import scrape_budget_snapshot, scrape_transfer_status
-from ..io.artifacts import ensure_state_dirs, read_json, run_artifacts_dir, utcstamp, write_json, safe_filename
+from ..io.artifacts import cached_json, dumps_pretty, ensure_state_dirs, read_json, run_artifacts_dir, utcstamp, write_json, safe_filename
 from ..logic.diff import compute_diff, normalize_name, as_set
-from ..mappings import CONSTRUCTOR_ABBR_TO_FULL, DRIVER_ABBR_TO_FULL, map_optimal_to_ideal
-from ..models import TeamSpec
-from ..site.browser import launch_persistent_context
-from ..site.sync import FantasySync, take_screenshot
+from ..mappings import (
+    CONSTRUCTOR_ABBR_TO_FULL,
+    DRIVER_ABBR_TO_FULL,
+    FULL_TO_CONSTRUCTOR_ABBR,
+    FULL_TO_DRIVER_ABBR,
+    map_optimal_to_ideal,
+)
+from ..models import BudgetSnapshot, TeamSpec
+from ..site.browser import browser_context
+from ..site.sync import FantasySync, flush_screenshots, take_screenshot
 
 
 def _combine_optimal_with_prices(*, optimal: dict, price_maps: dict) -> dict:
@@ -22,32 +32,45 @@ def _combine_optimal_with_prices(*, optimal: dict, price_maps: dict) -> dict:
     opt_con = list(optimal.get("constructors") or [])
     boost = optimal.get("boost")
 
-    drivers_with_prices = [
-        {
-            "abbr": abbr,
-            "name": DRIVER_ABBR_TO_FULL.get(abbr),
-            "price_m": price_maps.get("drivers", {}).get(abbr),
-            "boosted": (abbr == boost),
-        }
-        for abbr in opt_dr
-    ]
-    constructors_with_prices = [
-        {
-            "abbr": abbr,
-            "name": CONSTRUCTOR_ABBR_TO_FULL.get(abbr),
-            "price_m": price_maps.get("constructors", {}).get(abbr),
-        }
-        for abbr in opt_con
-    ]
+    # Hoist the price maps and sum while building the rows; the old version
+    # re-fetched price_maps["drivers"/"constructors"] per row and then walked
+    # a concatenated copy of both lists just to total them.
+    dmap = price_maps.get("drivers") or {}
+    cmap = price_maps.get("constructors") or {}
 
     total_m = 0.0
     missing: list[str] = []
-    for row in drivers_with_prices + constructors_with_prices:
-        pm = row.get("price_m")
-        if pm is None:
-            missing.append(str(row.get("abbr")))
-            continue
-        total_m += float(pm)
+
+    drivers_with_prices = []
+    for abbr in opt_dr:
+        price_m = dmap.get(abbr)
+        if price_m is None:
+            missing.append(abbr)
+        else:
+            total_m += float(price_m)
+        drivers_with_prices.append(
+            {
+                "abbr": abbr,
+                "name": DRIVER_ABBR_TO_FULL.get(abbr),
+                "price_m": price_m,
+                "boosted": (abbr == boost),
+            }
+        )
+
+    constructors_with_prices = []
+    for abbr in opt_con:
+        price_m = cmap.get(abbr)
+        if price_m is None:
+            missing.append(abbr)
+        else:
+            total_m += float(price_m)
+        constructors_with_prices.append(
+            {
+                "abbr": abbr,
+                "name": CONSTRUCTOR_ABBR_TO_FULL.get(abbr),
+                "price_m": price_m,
+            }
+        )
 
     return {
         "drivers": drivers_with_prices,
@@ -57,6 +80,16 @@ def _combine_optimal_with_prices(*, optimal: dict, price_maps: dict) -> dict:
     }
 
 
+def _abbreviate_transfers(diff: dict, direction: str) -> list[str]:
+    # Compact "HAM"/"RBR"-style summary of one side of a diff for the policy
+    # decision; names a roster update hasn't reached yet pass through whole.
+    drivers = diff.get(f"drivers_{direction}") or []
+    constructors = diff.get(f"constructors_{direction}") or []
+    return [FULL_TO_DRIVER_ABBR.get(n, n) for n in drivers] + [
+        FULL_TO_CONSTRUCTOR_ABBR.get(n, n) for n in constructors
+    ]
+
+
 def sync_team_to_ideal(
     *,
     team_id: int,
@@ -66,15 +99,18 @@ def sync_team_to_ideal(
     headful: bool,
     apply: bool,
     force: bool,
+    ctx: BrowserContext | None = None,
 ) -> dict:
     """Sync team state to match ideal; writes state/team_state.json and history snapshots.
 
     Returns a dict with keys:
-      {"site_before": ..., "site_after": ..., "diff": ..., "run_dir": ...}
+      {"site_before": ..., "site_after": ..., "diff": ..., "verify_diff": ..., "run_dir": ...}
 
     Notes:
       - When apply=False, site_after is None.
       - When apply=True, site_before is scraped immediately before applying.
+      - Pass ``ctx`` to reuse an already-launched browser context; otherwise
+        one is launched and shared across the dry-run and apply phases.
     """
 
     ensure_state_dirs()
@@ -87,42 +123,71 @@ def sync_team_to_ideal(
         local_diff = compute_diff(local, ts.to_dict())
         if local_diff.get("noop"):
             print("Local state already matches ideal; exiting without changes.", flush=True)
-            return {"site_before": local, "site_after": local, "diff": local_diff, "run_dir": None}
+            return {
+                "site_before": local,
+                "site_after": local,
+                "diff": local_diff,
+                "verify_diff": local_diff,
+                "run_dir": None,
+            }
 
     run_dir = run_artifacts_dir(team_id=team_id)
-    write_json(run_dir / "ideal.json", ts.to_dict())
-
-    def _sync_once(*, do_apply: bool) -> tuple[dict, dict]:
-        with sync_playwright() as p:
-            ctx = launch_persistent_context(playwright=p, profile_dir=profile_dir, headful=headful)
-            page = ctx.new_page()
-            syncer = FantasySync(page, team_id, expected_team_name, run_dir)
+    write_json(run_dir / "ideal.json", ts.to_dict(), sort_keys=False)
+
+    def _sync_once(bctx: BrowserContext, *, do_apply: bool) -> tuple[dict, dict, dict]:
+        page = bctx.new_page()
+        syncer = FantasySync(page, team_id, expected_team_name, run_dir)
+        try:
+            return syncer.sync_to_ideal(ts.to_dict(), apply=do_apply)
+        except Exception:
             try:
-                state, d = syncer.sync_to_ideal(ts.to_dict(), apply=do_apply)
-                return state, d
+                take_screenshot(page, run_dir / "error.png", force=True)
             except Exception:
-                try:
-                    take_screenshot(page, run_dir / "error.png")
-                except Exception:
-                    pass
-                raise
-            finally:
-                ctx.close()
-
-    if not apply:
-        before, diff = _sync_once(do_apply=False)
-        return {"site_before": before, "site_after": None, "diff": diff, "run_dir": str(run_dir)}
-
-    site_before, _ = _sync_once(do_apply=False)
-    site_after, diff = _sync_once(do_apply=True)
+                pass
+            raise
+        finally:
+            page.close()
+            flush_screenshots()
+
+    # Launch at most one browser; dry-run and apply phases share it.
+    cm = nullcontext(ctx) if ctx is not None else browser_context(profile_dir=profile_dir, headful=headful)
+    with cm as bctx:
+        if not apply:
+            before, diff, _ = _sync_once(bctx, do_apply=False)
+            # Refresh the local cache from the scrape so a repeated dry run
+            # that is already noop can return above without a browser launch.
+            write_json(state_path, before)
+            return {
+                "site_before": before,
+                "site_after": None,
+                "diff": diff,
+                "verify_diff": diff,
+                "run_dir": str(run_dir),
+            }
+
+        site_before, _, _ = _sync_once(bctx, do_apply=False)
+        site_after, diff, verify_diff = _sync_once(bctx, do_apply=True)
 
     write_json(state_path, site_after)
     hist_name = f"team_state_{safe_filename(site_after['ts_utc'])}_team{team_id}.json"
-    shutil.copy2(state_path, config.HISTORY_DIR / hist_name)
+    hist_path = config.HISTORY_DIR / hist_name
+    # Snapshots are immutable (write_json swaps in a fresh inode on the next
+    # update), so a hard link archives without copying bytes; fall back to a
+    # copy when history lives on another filesystem.
+    try:
+        os.link(state_path, hist_path)
+    except OSError:
+        shutil.copy2(state_path, hist_path)
 
     write_json(config.STATE_DIR / "last_applied.json", {"ts_utc": utcstamp(), "ideal": ts.to_dict()})
 
-    return {"site_before": site_before, "site_after": site_after, "diff": diff, "run_dir": str(run_dir)}
+    return {
+        "site_before": site_before,
+        "site_after": site_after,
+        "diff": diff,
+        "verify_diff": verify_diff,
+        "run_dir": str(run_dir),
+    }
 
 
 def run_end_to_end(
@@ -137,6 +202,8 @@ def run_end_to_end(
     force: bool,
     url: str | None,
     boost_driver_override: str | None,
+    refresh: bool = False,
+    ctx: BrowserContext | None = None,
 ) -> dict[str, Any]:
     """scrape budget -> compute optimal -> map ideal -> (optional) sync -> verify -> write bundle.
 
@@ -152,95 +219,169 @@ def run_end_to_end(
     ensure_state_dirs()
     ts_utc = utcstamp()
 
-    budget_snapshot = None
-    cap_m: float
-    if budget is None or (isinstance(budget, str) and budget.lower() == "auto"):
-        budget_snapshot = scrape_budget_snapshot(team_id=team_id, profile_dir=profile_dir, headful=headful)
-        cap_m = float(budget_snapshot.cap_m)
-    else:
-        cap_m = float(budget)
-
-    optimal, price_maps = load_optimal_and_prices(cap_m, url=url)
-    ideal = map_optimal_to_ideal(optimal)
-
-    if boost_driver_override:
-        if boost_driver_override not in ideal["drivers"]:
-            raise SystemExit("boost-driver-override must be one of the 5 optimal drivers")
-        ideal["boost_driver"] = boost_driver_override
-
-    TeamSpec.from_dict(ideal)  # validate
-
-    ideal_out.parent.mkdir(parents=True, exist_ok=True)
-    ideal_out.write_text(__import__("json").dumps(ideal, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-
-    if budget_snapshot:
-        write_json(config.STATE_DIR / "last_budget.json", budget_snapshot.to_dict())
-
-    write_json(config.STATE_DIR / "last_optimal.json", optimal)
-
-    combined = {
-        "ts_utc": ts_utc,
-        "budget": budget_snapshot.to_dict() if budget_snapshot else {"cap_m": cap_m},
-        "optimal": optimal,
-        **_combine_optimal_with_prices(optimal=optimal, price_maps=price_maps),
-        "remaining_m": (budget_snapshot.remaining_m if budget_snapshot else None),
-        "used_m": (budget_snapshot.used_m if budget_snapshot else None),
-        "cap_m": (budget_snapshot.cap_m if budget_snapshot else cap_m),
-    }
-    write_json(config.STATE_DIR / "last_optimal_with_budget.json", combined)
-
-    # Always fetch the current site state + diff first so we can make a transfer policy decision.
-    pre = sync_team_to_ideal(
-        team_id=team_id,
-        ideal=ideal,
-        expected_team_name=expected_team_name,
-        profile_dir=profile_dir,
-        headful=headful,
-        apply=False,
-        force=True,
-    )
-    site_before = pre.get("site_before")
-    diff = pre.get("diff")
-
-    transfer_status = scrape_transfer_status(team_id=team_id, profile_dir=profile_dir, headful=headful)
-
-    transfers_required = int(diff.get("transfers_required") or 0)
-    free_transfers = int(transfer_status.free_transfers)
-    apply_allowed = transfers_required <= free_transfers
-    policy_decision = {
-        "apply": bool(apply_allowed),
-        "reason": (
-            "Within free transfers"
-            if apply_allowed
-            else f"Would require {transfers_required} transfers; only {free_transfers} free transfers available"
-        ),
-        "transfers_required": transfers_required,
-        "free_transfers": free_transfers,
-    }
-
-    site_after = None
-    verify = {"ok": False}
+    # One browser serves the budget scrape, transfer-status scrape, and both
+    # sync phases; launching per step cost several seconds each. A caller
+    # driving several teams passes its own context in. The launch itself is
+    # lazy: the budget cache, the pure-HTTP f1fantasytools fetch, the
+    # optimizer, and the ideal-digest check all run browser-free, so the
+    # cache-hit noop path below returns without ever starting Chromium.
+    with ExitStack() as stack:
+        shared_ctx = ctx
+
+        def get_ctx() -> BrowserContext:
+            nonlocal shared_ctx
+            if shared_ctx is None:
+                shared_ctx = stack.enter_context(
+                    browser_context(profile_dir=profile_dir, headful=headful)
+                )
+            return shared_ctx
+
+        budget_snapshot = None
+        cap_m: float
+        fetch_age = 0.0 if refresh else 300.0
+        if budget is None or (isinstance(budget, str) and budget.lower() == "auto"):
+            # The f1fantasytools fetch+parse is pure HTTP and independent of
+            # the browser, so it runs in a worker thread while the browser
+            # scrapes the budget; wall-clock is the longer of the two instead
+            # of their sum. The optimizer itself needs the cap, so it runs
+            # after both finish.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                data_future = pool.submit(load_data_and_prices, url, max_age_s=fetch_age)
+                # Re-scraping the budget is a full page navigation; within the
+                # TTL the snapshot from the last run is current enough.
+                snap_dict = cached_json(
+                    config.STATE_DIR / "cache" / f"budget_team{team_id}.json",
+                    300,
+                    lambda: scrape_budget_snapshot(
+                        team_id=team_id, profile_dir=profile_dir, headful=headful, ctx=get_ctx()
+                    ).to_dict(),
+                    force=refresh,
+                )
+            budget_snapshot = BudgetSnapshot(**snap_dict)
+            cap_m = float(budget_snapshot.cap_m)
+            data, price_maps = data_future.result()
+        else:
+            cap_m = float(budget)
+            data, price_maps = load_data_and_prices(url, max_age_s=fetch_age)
+
+        optimal = compute_optimal(cap_m, data)
+        ideal = map_optimal_to_ideal(optimal)
+
+        if boost_driver_override:
+            if boost_driver_override not in ideal["drivers"]:
+                raise SystemExit("boost-driver-override must be one of the 5 optimal drivers")
+            ideal["boost_driver"] = boost_driver_override
+
+        TeamSpec.from_dict(ideal)  # validate
+
+        # If the optimal team hasn't moved since the last run and the cached
+        # site state already matches it, there is nothing to sync or verify.
+        ideal_digest = hashlib.sha256(dumps_pretty(ideal).encode()).hexdigest()
+        digest_path = config.STATE_DIR / "last_ideal.sha256"
+        if not force:
+            prev_digest = digest_path.read_text().strip() if digest_path.exists() else None
+            local = read_json(config.STATE_DIR / "team_state.json", default=None)
+            if prev_digest == ideal_digest and local:
+                local_diff = compute_diff(local, ideal)
+                if local_diff.get("noop"):
+                    print("Ideal unchanged and team already matches; skipping sync.", flush=True)
+                    bundle = {
+                        "schema_version": 1,
+                        "ts_utc": ts_utc,
+                        "inputs": {
+                            "team_id": team_id,
+                            "budget": {"cap_m": cap_m},
+                            "price_source": "f1fantasytools",
+                            "sim": optimal.get("sim"),
+                            "apply_requested": bool(apply),
+                        },
+                        "ideal": ideal,
+                        "site_before": local,
+                        "diff": local_diff,
+                        "policy_decision": {"apply": False, "reason": "Ideal unchanged; nothing to sync"},
+                        "site_after": local,
+                        "verify": {"ok": True, "diff_final_vs_ideal": local_diff},
+                    }
+                    write_json(config.STATE_DIR / "last_run.json", bundle)
+                    return bundle
+
+        write_json(ideal_out, ideal)
+
+        if budget_snapshot:
+            write_json(config.STATE_DIR / "last_budget.json", budget_snapshot.to_dict())
+
+        write_json(config.STATE_DIR / "last_optimal.json", optimal)
+
+        combined = {
+            "ts_utc": ts_utc,
+            "budget": budget_snapshot.to_dict() if budget_snapshot else {"cap_m": cap_m},
+            "optimal": optimal,
+            **_combine_optimal_with_prices(optimal=optimal, price_maps=price_maps),
+            "remaining_m": (budget_snapshot.remaining_m if budget_snapshot else None),
+            "used_m": (budget_snapshot.used_m if budget_snapshot else None),
+            "cap_m": (budget_snapshot.cap_m if budget_snapshot else cap_m),
+        }
+        write_json(config.STATE_DIR / "last_optimal_with_budget.json", combined)
 
-    if apply and apply_allowed:
-        res = sync_team_to_ideal(
+        # Always fetch the current site state + diff first so we can make a transfer policy decision.
+        pre = sync_team_to_ideal(
             team_id=team_id,
             ideal=ideal,
             expected_team_name=expected_team_name,
             profile_dir=profile_dir,
             headful=headful,
-            apply=True,
-            force=force,
+            apply=False,
+            force=True,
+            ctx=get_ctx(),
         )
-        site_before = res.get("site_before")
-        site_after = res.get("site_after")
-        diff = res.get("diff")
+        site_before = pre.get("site_before")
+        diff = pre.get("diff")
 
-        if site_after is not None:
-            final_diff = compute_diff(site_after, ideal)
-            verify = {"ok": bool(final_diff.get("noop")), "diff_final_vs_ideal": final_diff}
-    else:
-        # Not applying (either --apply was not requested or policy blocked it).
-        verify = {"ok": bool(diff.get("noop")), "diff_final_vs_ideal": diff}
+        transfer_status = scrape_transfer_status(
+            team_id=team_id, profile_dir=profile_dir, headful=headful, ctx=get_ctx()
+        )
+
+        transfers_required = int(diff.get("transfers_required") or 0)
+        free_transfers = int(transfer_status.free_transfers)
+        apply_allowed = transfers_required <= free_transfers
+        policy_decision = {
+            "apply": bool(apply_allowed),
+            "reason": (
+                "Within free transfers"
+                if apply_allowed
+                else f"Would require {transfers_required} transfers; only {free_transfers} free transfers available"
+            ),
+            "transfers_required": transfers_required,
+            "free_transfers": free_transfers,
+            "transfers_out": _abbreviate_transfers(diff, "remove"),
+            "transfers_in": _abbreviate_transfers(diff, "add"),
+        }
+
+        site_after = None
+        verify = {"ok": False}
+
+        if apply and apply_allowed:
+            res = sync_team_to_ideal(
+                team_id=team_id,
+                ideal=ideal,
+                expected_team_name=expected_team_name,
+                profile_dir=profile_dir,
+                headful=headful,
+                apply=True,
+                force=force,
+                ctx=get_ctx(),
+            )
+            site_before = res.get("site_before")
+            site_after = res.get("site_after")
+            diff = res.get("diff")
+
+            if site_after is not None:
+                # The apply pass already diffed final state vs ideal; reuse it.
+                final_diff = res.get("verify_diff") or compute_diff(site_after, ideal)
+                verify = {"ok": bool(final_diff.get("noop")), "diff_final_vs_ideal": final_diff}
+        else:
+            # Not applying (either --apply was not requested or policy blocked it).
+            verify = {"ok": bool(diff.get("noop")), "diff_final_vs_ideal": diff}
 
     bundle = {
         "schema_version": 1,
@@ -262,5 +403,51 @@ def run_end_to_end(
         "verify": verify,
     }
 
+    digest_path.write_text(ideal_digest + "\n", encoding="utf-8")
     write_json(config.STATE_DIR / "last_run.json", bundle)
     return bundle
+
+
+def run_end_to_end_many(
+    *,
+    team_ids: list[int],
+    budget: float | str | None,
+    expected_team_name: str | None,
+    ideal_out: Path,
+    profile_dir: str,
+    headful: bool,
+    apply: bool,
+    force: bool,
+    url: str | None,
+    boost_driver_override: str | None,
+    refresh: bool = False,
+) -> dict[int, dict[str, Any]]:
+    """Run the end-to-end flow for several teams over one shared browser.
+
+    Teams run back to back on the same persistent context, so the multi-second
+    Chromium launch and the warm HTTP cache are paid once rather than per
+    team. Each team gets its own ideal file (``<stem>_team<id><suffix>``).
+    A failing team does not stop the rest; its entry carries the error.
+    """
+    results: dict[int, dict[str, Any]] = {}
+    with browser_context(profile_dir=profile_dir, headful=headful) as ctx:
+        for team_id in team_ids:
+            out = ideal_out.with_name(f"{ideal_out.stem}_team{team_id}{ideal_out.suffix}")
+            try:
+                results[team_id] = run_end_to_end(
+                    team_id=team_id,
+                    budget=budget,
+                    expected_team_name=expected_team_name,
+                    ideal_out=out,
+                    profile_dir=profile_dir,
+                    headful=headful,
+                    apply=apply,
+                    force=force,
+                    url=url,
+                    boost_driver_override=boost_driver_override,
+                    refresh=refresh,
+                    ctx=ctx,
+                )
+            except Exception as e:  # keep going; the other teams are independent
+                results[team_id] = {"error": f"{type(e).__name__}: {e}"}
+    return results
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-# Drivers (2026 preseason set as observed). Adjust as needed.
-DRIVER_ABBR_TO_FULL: dict[str, str] = {
+from types import MappingProxyType
+from typing import Mapping
+
+# Drivers (2026 preseason set as observed). Adjust as needed. Both maps are
+# read-only views: they are fixed at import time and nothing may mutate them.
+DRIVER_ABBR_TO_FULL: Mapping[str, str] = MappingProxyType({
     "VER": "Max Verstappen",
     "RUS": "George Russell",
     "NOR": "Lando Norris",
@@ -24,9 +28,9 @@ DRIVER_ABBR_TO_FULL: dict[str, str] = {
     "COL": "Franco Colapinto",
     "PER": "Sergio Perez",
     "BOT": "Valtteri Bottas",
-}
+})
 
-CONSTRUCTOR_ABBR_TO_FULL: dict[str, str] = {
+CONSTRUCTOR_ABBR_TO_FULL: Mapping[str, str] = MappingProxyType({
     "MCL": "McLaren",
     "FER": "Ferrari",
     "MER": "Mercedes",
@@ -40,27 +44,40 @@ CONSTRUCTOR_ABBR_TO_FULL: dict[str, str] = {
     # Some data sources use the older/alternate abbreviation for Racing Bulls.
     "VRB": "Racing Bulls",
     "CAD": "Cadillac",
-}
+})
+
+# Reverse indexes for full-name -> abbreviation lookups. First abbreviation
+# wins, so alias entries (VRB) don't shadow the canonical one (RB).
+FULL_TO_DRIVER_ABBR: Mapping[str, str] = MappingProxyType(
+    {full: abbr for abbr, full in reversed(DRIVER_ABBR_TO_FULL.items())}
+)
+FULL_TO_CONSTRUCTOR_ABBR: Mapping[str, str] = MappingProxyType(
+    {full: abbr for abbr, full in reversed(CONSTRUCTOR_ABBR_TO_FULL.items())}
+)
 
 
 def map_optimal_to_ideal(optimal: dict) -> dict:
-    drivers: list[str] = []
-    for abbr in optimal.get("drivers") or []:
-        if abbr not in DRIVER_ABBR_TO_FULL:
-            raise RuntimeError(f"Unknown driver abbreviation '{abbr}'. Add it to DRIVER_ABBR_TO_FULL.")
-        drivers.append(DRIVER_ABBR_TO_FULL[abbr])
+    # One probe per abbreviation (the in-check + subscript pair did two) and
+    # the unknown-abbr case is handled once via KeyError.
+    try:
+        drivers = list(map(DRIVER_ABBR_TO_FULL.__getitem__, optimal.get("drivers") or []))
+    except KeyError as e:
+        raise RuntimeError(
+            f"Unknown driver abbreviation '{e.args[0]}'. Add it to DRIVER_ABBR_TO_FULL."
+        ) from None
 
-    constructors: list[str] = []
-    for abbr in optimal.get("constructors") or []:
-        if abbr not in CONSTRUCTOR_ABBR_TO_FULL:
-            raise RuntimeError(f"Unknown constructor abbreviation '{abbr}'. Add it to CONSTRUCTOR_ABBR_TO_FULL.")
-        constructors.append(CONSTRUCTOR_ABBR_TO_FULL[abbr])
+    try:
+        constructors = list(map(CONSTRUCTOR_ABBR_TO_FULL.__getitem__, optimal.get("constructors") or []))
+    except KeyError as e:
+        raise RuntimeError(
+            f"Unknown constructor abbreviation '{e.args[0]}'. Add it to CONSTRUCTOR_ABBR_TO_FULL."
+        ) from None
 
     boost_abbr = optimal.get("boost")
     boost_driver = None
     if boost_abbr:
-        if boost_abbr not in DRIVER_ABBR_TO_FULL:
+        boost_driver = DRIVER_ABBR_TO_FULL.get(boost_abbr)
+        if boost_driver is None:
             raise RuntimeError(f"Unknown boost abbreviation '{boost_abbr}'.")
-        boost_driver = DRIVER_ABBR_TO_FULL[boost_abbr]
 
     return {"drivers": drivers, "constructors": constructors, "boost_driver": boost_driver}
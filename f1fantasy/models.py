@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -26,6 +26,9 @@ class TeamSpec:
     def validate(self) -> None:
         _require_list("drivers", self.drivers, n=5)
         _require_list("constructors", self.constructors, n=2)
+        self._validate_boost()
+
+    def _validate_boost(self) -> None:
         if self.boost_driver is not None:
             if not isinstance(self.boost_driver, str) or not self.boost_driver.strip():
                 raise ValueError("boost_driver must be a non-empty string or None")
@@ -33,7 +36,13 @@ class TeamSpec:
                 raise ValueError("boost_driver must be one of the 5 drivers")
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Direct literal: asdict() recursively deep-copies via reflection,
+        # which is wasted work for these flat records on the write path.
+        return {
+            "drivers": list(self.drivers),
+            "constructors": list(self.constructors),
+            "boost_driver": self.boost_driver,
+        }
 
     @staticmethod
     def from_dict(d: dict[str, Any]) -> "TeamSpec":
@@ -42,7 +51,8 @@ class TeamSpec:
             constructors=_require_list("constructors", d.get("constructors"), n=2),
             boost_driver=d.get("boost_driver"),
         )
-        ts.validate()
+        # The two lists just passed _require_list; only the boost needs checking.
+        ts._validate_boost()
         return ts
 
 
@@ -55,7 +65,13 @@ class BudgetSnapshot:
     source: str = "fantasy.formula1.com"
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "remaining_m": self.remaining_m,
+            "used_m": self.used_m,
+            "cap_m": self.cap_m,
+            "currency": self.currency,
+            "source": self.source,
+        }
 
 
 @dataclass(frozen=True)
@@ -68,7 +84,14 @@ class TransferStatus:
     source: str = "site"
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "ts_utc": self.ts_utc,
+            "team_id": self.team_id,
+            "free_transfers": self.free_transfers,
+            "penalty_points_per_extra": self.penalty_points_per_extra,
+            "url": self.url,
+            "source": self.source,
+        }
 
 
 @dataclass(frozen=True)
@@ -85,10 +108,18 @@ class TeamState:
     source: str = "site"
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        if self.budget is not None:
-            d["budget"] = self.budget.to_dict()
-        return d
+        return {
+            "ts_utc": self.ts_utc,
+            "team_id": self.team_id,
+            "team_name": self.team_name,
+            "drivers": list(self.drivers),
+            "constructors": list(self.constructors),
+            "boost_driver": self.boost_driver,
+            "budget": self.budget.to_dict() if self.budget is not None else None,
+            "score": self.score,
+            "url": self.url,
+            "source": self.source,
+        }
 
 
 @dataclass(frozen=True)
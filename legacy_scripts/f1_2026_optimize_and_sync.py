@@ -9,15 +9,15 @@ The implementation has moved into the f1fantasy/ package; this script keeps the
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(BASE_DIR))
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
 
 from f1fantasy import config
-from f1fantasy.io.artifacts import ensure_state_dirs
+from f1fantasy.io.artifacts import ensure_state_dirs, dumps_pretty
 from f1fantasy.logic.orchestrator import run_end_to_end
 
 
@@ -58,7 +58,7 @@ def main() -> int:
         boost_driver_override=args.boost_driver_override,
     )
 
-    print(json.dumps(bundle, indent=2, sort_keys=True))
+    print(dumps_pretty(bundle))
     return 0
 
 
@@ -9,15 +9,15 @@ The implementation has moved into the f1fantasy/ package.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(BASE_DIR))
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
 
 from f1fantasy import config
-from f1fantasy.io.artifacts import ensure_state_dirs, read_json
+from f1fantasy.io.artifacts import ensure_state_dirs, read_json, dumps_pretty
 from f1fantasy.logic.orchestrator import sync_team_to_ideal
 from f1fantasy.models import TeamSpec
 
@@ -53,7 +53,7 @@ def main() -> int:
     )
 
     # Preserve scripts' "human" output (prints something JSON-ish)
-    print(json.dumps(res, indent=2, sort_keys=True))
+    print(dumps_pretty(res))
     return 0
 
 
@@ -9,14 +9,15 @@ Output JSON matches prior behavior.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(BASE_DIR))
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
 
 from f1fantasy.data_sources import f1fantasytools as ft
+from f1fantasy.io.artifacts import dumps_pretty
 
 
 def main() -> int:
@@ -30,7 +31,7 @@ def main() -> int:
     data = ft.extract_json_object_from_payload(payload)
 
     out = ft.compute_optimal(args.budget, data)
-    print(json.dumps(out, indent=2, sort_keys=True))
+    print(dumps_pretty(out))
     return 0
 
 
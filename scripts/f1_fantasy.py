@@ -13,32 +13,38 @@ This is the new entrypoint replacing the older single-purpose scripts.
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import sys
 from pathlib import Path
 
 # Ensure repo root is on sys.path when invoked as a script.
 BASE_DIR = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(BASE_DIR))
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
 
 from f1fantasy import config
-from f1fantasy.data_sources.f1fantasytools import load_optimal_and_prices
-from f1fantasy.data_sources.official_site import scrape_budget_snapshot
-from f1fantasy.io.artifacts import ensure_state_dirs, write_json, read_json
-from f1fantasy.logic.orchestrator import run_end_to_end, sync_team_to_ideal
+from f1fantasy.data_sources.f1fantasytools import compute_optimal, load_data_and_prices, load_optimal_and_prices
+from f1fantasy.io.artifacts import ensure_state_dirs, write_json, read_json, dumps_pretty
 from f1fantasy.mappings import map_optimal_to_ideal
 from f1fantasy.models import TeamSpec
 
+# Anything that pulls in Playwright (the scrapers and the orchestrator) is
+# imported inside the command handlers: `optimal` with an explicit --budget
+# and plain JSON work shouldn't pay the browser stack's import cost.
+
 
 def cmd_budget(args: argparse.Namespace) -> int:
+    from f1fantasy.data_sources.official_site import scrape_budget_snapshot
+
     ensure_state_dirs()
     snap = scrape_budget_snapshot(team_id=args.team_id, profile_dir=args.profile_dir, headful=args.headful)
     out = snap.to_dict()
     if args.out:
-        Path(args.out).write_text(json.dumps(out, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        write_json(Path(args.out), out)
     if args.write_state:
         write_json(config.STATE_DIR / "last_budget.json", out)
-    print(json.dumps(out, indent=2, sort_keys=True))
+    if not args.quiet:
+        print(dumps_pretty(out))
     return 0
 
 
@@ -48,10 +54,22 @@ def cmd_optimal(args: argparse.Namespace) -> int:
     budget = args.budget
     budget_snapshot = None
     if isinstance(budget, str) and budget.lower() == "auto":
-        budget_snapshot = scrape_budget_snapshot(team_id=args.team_id, profile_dir=args.profile_dir, headful=args.headful)
-        budget = float(budget_snapshot.cap_m)
+        from concurrent.futures import ThreadPoolExecutor
 
-    optimal, price_maps = load_optimal_and_prices(float(budget), url=args.url)
+        from f1fantasy.data_sources.official_site import scrape_budget_snapshot
+
+        # Overlap the pure-HTTP fetch+parse with the browser budget scrape;
+        # only compute_optimal needs the scraped cap.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            data_future = pool.submit(load_data_and_prices, args.url)
+            budget_snapshot = scrape_budget_snapshot(
+                team_id=args.team_id, profile_dir=args.profile_dir, headful=args.headful
+            )
+        budget = float(budget_snapshot.cap_m)
+        data, price_maps = data_future.result()
+        optimal = compute_optimal(budget, data)
+    else:
+        optimal, price_maps = load_optimal_and_prices(float(budget), url=args.url)
     ideal = map_optimal_to_ideal(optimal)
 
     if args.boost_driver_override:
@@ -62,7 +80,7 @@ def cmd_optimal(args: argparse.Namespace) -> int:
     TeamSpec.from_dict(ideal)  # validate
 
     if args.ideal_out:
-        Path(args.ideal_out).write_text(json.dumps(ideal, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        write_json(Path(args.ideal_out), ideal)
 
     if budget_snapshot is not None:
         write_json(config.STATE_DIR / "last_budget.json", budget_snapshot.to_dict())
@@ -75,7 +93,8 @@ def cmd_optimal(args: argparse.Namespace) -> int:
         "ideal": ideal,
         "prices": price_maps,
     }
-    print(json.dumps(out, indent=2, sort_keys=True))
+    if not args.quiet:
+        print(dumps_pretty(out))
     return 0
 
 
@@ -87,6 +106,8 @@ def cmd_sync(args: argparse.Namespace) -> int:
 
     TeamSpec.from_dict(ideal)  # validate
 
+    from f1fantasy.logic.orchestrator import sync_team_to_ideal
+
     res = sync_team_to_ideal(
         team_id=args.team_id,
         ideal=ideal,
@@ -97,13 +118,82 @@ def cmd_sync(args: argparse.Namespace) -> int:
         force=args.force,
     )
 
-    print(json.dumps(res, indent=2, sort_keys=True))
+    if not args.quiet:
+        print(dumps_pretty(res))
+    return 0
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    ensure_state_dirs()
+
+    from f1fantasy.logic.daemon import serve
+
+    serve(
+        profile_dir=args.profile_dir,
+        headful=args.headful,
+        socket_path=(Path(args.socket) if args.socket else None),
+    )
     return 0
 
 
 def cmd_run(args: argparse.Namespace) -> int:
     ensure_state_dirs()
 
+    if args.team_ids:
+        if args.daemon:
+            raise SystemExit("--team-ids runs over its own shared browser; combine it with --daemon per team instead")
+        try:
+            team_ids = [int(t) for t in args.team_ids.split(",") if t.strip()]
+        except ValueError:
+            raise SystemExit(f"--team-ids must be comma-separated integers, got: {args.team_ids}")
+
+        from f1fantasy.logic.orchestrator import run_end_to_end_many
+
+        results = run_end_to_end_many(
+            team_ids=team_ids,
+            budget=args.budget,
+            expected_team_name=args.expected_team_name,
+            ideal_out=Path(args.ideal_out),
+            profile_dir=args.profile_dir,
+            headful=args.headful,
+            apply=args.apply,
+            force=args.force,
+            url=args.url,
+            boost_driver_override=args.boost_driver_override,
+            refresh=args.force_refresh,
+        )
+        out = {str(team_id): bundle for team_id, bundle in results.items()}
+        if args.out:
+            write_json(Path(args.out), out)
+        if not args.quiet:
+            print(dumps_pretty(out))
+        return 0
+
+    if args.daemon:
+        from f1fantasy.logic.daemon import submit_job
+
+        bundle = submit_job(
+            {
+                "cmd": "run",
+                "team_id": args.team_id,
+                "budget": args.budget,
+                "expected_team_name": args.expected_team_name,
+                "ideal_out": args.ideal_out,
+                "apply": args.apply,
+                "force": args.force,
+                "url": args.url,
+                "boost_driver_override": args.boost_driver_override,
+                "refresh": args.force_refresh,
+            }
+        )
+        if args.out:
+            write_json(Path(args.out), bundle)
+        if not args.quiet:
+            print(dumps_pretty(bundle))
+        return 0
+
+    from f1fantasy.logic.orchestrator import run_end_to_end
+
     bundle = run_end_to_end(
         team_id=args.team_id,
         budget=args.budget,
@@ -115,16 +205,21 @@ def cmd_run(args: argparse.Namespace) -> int:
         force=args.force,
         url=args.url,
         boost_driver_override=args.boost_driver_override,
+        refresh=args.force_refresh,
     )
 
     if args.out:
-        Path(args.out).write_text(json.dumps(bundle, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        write_json(Path(args.out), bundle)
 
-    print(json.dumps(bundle, indent=2, sort_keys=True))
+    if not args.quiet:
+        print(dumps_pretty(bundle))
     return 0
 
 
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    # Cached so in-process repeat invocations (cron retries, tests) build the
+    # parser once.
     ap = argparse.ArgumentParser(prog="f1_fantasy")
     sub = ap.add_subparsers(dest="cmd", required=True)
 
@@ -134,6 +229,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_budget.add_argument("--headful", action="store_true")
     p_budget.add_argument("--out", default=None, help="Optional output path")
     p_budget.add_argument("--write-state", action="store_true", help="Also write state/last_budget.json")
+    p_budget.add_argument("--quiet", action="store_true", help="Skip printing the result JSON (state/--out writes still happen)")
     p_budget.set_defaults(func=cmd_budget)
 
     p_opt = sub.add_parser("optimal", help="Compute optimal team using f1fantasytools")
@@ -146,6 +242,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_opt.add_argument("--boost-driver-override", default=None)
     # Convenience flag (matches older workflow). Currently state JSONs are written by default.
     p_opt.add_argument("--write-state", action="store_true", help="(No-op) Kept for compatibility; state files are written by default")
+    p_opt.add_argument("--quiet", action="store_true", help="Skip printing the result JSON (state/--out writes still happen)")
     p_opt.set_defaults(func=cmd_optimal)
 
     p_sync = sub.add_parser("sync", help="Sync official team to an ideal JSON spec")
@@ -156,10 +253,18 @@ def build_parser() -> argparse.ArgumentParser:
     p_sync.add_argument("--headful", action="store_true")
     p_sync.add_argument("--no-apply", action="store_true")
     p_sync.add_argument("--force", action="store_true")
+    p_sync.add_argument("--quiet", action="store_true", help="Skip printing the result JSON (state/--out writes still happen)")
     p_sync.set_defaults(func=cmd_sync)
 
+    p_daemon = sub.add_parser("daemon", help="Keep one browser alive and serve run jobs over a Unix socket")
+    p_daemon.add_argument("--profile-dir", default=config.DEFAULT_PROFILE_DIR)
+    p_daemon.add_argument("--headful", action="store_true")
+    p_daemon.add_argument("--socket", default=None, help="Socket path (default: state/daemon.sock)")
+    p_daemon.set_defaults(func=cmd_daemon)
+
     p_run = sub.add_parser("run", help="End-to-end run (budget->optimal->sync->verify)")
     p_run.add_argument("--team-id", type=int, default=1)
+    p_run.add_argument("--team-ids", default=None, help="Comma-separated team ids to run back to back over one browser (overrides --team-id)")
     p_run.add_argument("--budget", default="auto")
     p_run.add_argument("--expected-team-name", default=config.DEFAULT_EXPECTED_TEAM_NAME)
     p_run.add_argument("--ideal-out", default=str(config.BASE_DIR / "ideal_team.json"))
@@ -168,8 +273,11 @@ def build_parser() -> argparse.ArgumentParser:
     p_run.add_argument("--apply", action="store_true", help="Actually apply changes on the official site")
     p_run.add_argument("--force", action="store_true")
     p_run.add_argument("--url", default=None)
+    p_run.add_argument("--force-refresh", action="store_true", help="Bypass the 5-minute budget/optimizer caches")
+    p_run.add_argument("--daemon", action="store_true", help="Submit the run to a running `daemon` instead of launching a browser")
     p_run.add_argument("--boost-driver-override", default=None)
     p_run.add_argument("--out", default=None, help="Optional output path for last_run bundle")
+    p_run.add_argument("--quiet", action="store_true", help="Skip printing the result JSON (state/--out writes still happen)")
     p_run.set_defaults(func=cmd_run)
 
     return ap
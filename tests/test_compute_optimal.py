@@ -0,0 +1,111 @@
+import random
+import unittest
+from unittest import mock
+
+from f1fantasy.data_sources import f1fantasytools as ft
+from f1fantasy.data_sources.f1fantasytools import compute_optimal
+
+
+def _data(drivers, constructors):
+    """Build the embedded-payload shape compute_optimal expects.
+
+    drivers/constructors: {abbr: (price, pts)}
+    """
+    return {
+        "drivers": [
+            {"type": "driver", "id": str(i), "abbreviation": abbr, "price": price}
+            for i, (abbr, (price, _)) in enumerate(drivers.items())
+        ],
+        "constructors": [
+            {"type": "constructor", "abbreviation": abbr, "price": price}
+            for abbr, (price, _) in constructors.items()
+        ],
+        "analystSims": [
+            {
+                "id": "sim1",
+                "name": "test",
+                "raceweek": 1,
+                "season": 2026,
+                "drivers": {"pts": {str(i): pts for i, (_, (_, pts)) in enumerate(drivers.items())}},
+                "constructors": {"pts": {abbr: pts for abbr, (_, pts) in constructors.items()}},
+            }
+        ],
+    }
+
+
+def _kernels():
+    """Yield (name, patch) pairs forcing each selectable search kernel.
+
+    compute_optimal picks _search_numpy when numpy is importable and falls
+    back to _search_python otherwise, so a single environment only ever
+    exercises one of them. Patching ft.np to None forces the Python kernel;
+    the numpy variant is yielded only where numpy is actually installed.
+    """
+    yield "python", mock.patch.object(ft, "np", None)
+    if ft.np is not None:
+        yield "numpy", mock.patch.object(ft, "np", ft.np)
+
+
+class TestComputeOptimal(unittest.TestCase):
+    def test_picks_best_feasible_team_and_boost(self):
+        drivers = {
+            "AAA": (10.0, 50.0),
+            "BBB": (10.0, 40.0),
+            "CCC": (10.0, 30.0),
+            "DDD": (10.0, 20.0),
+            "EEE": (10.0, 10.0),
+            "FFF": (30.0, 55.0),  # best pts but unaffordable alongside the rest
+        }
+        constructors = {
+            "XXX": (10.0, 25.0),
+            "YYY": (10.0, 15.0),
+            "ZZZ": (10.0, 5.0),
+        }
+        for name, kernel_patch in _kernels():
+            with self.subTest(kernel=name), kernel_patch:
+                res = compute_optimal(70.0, _data(drivers, constructors))
+                self.assertEqual(res["drivers"], ["AAA", "BBB", "CCC", "DDD", "EEE"])
+                self.assertEqual(res["constructors"], ["XXX", "YYY"])
+                self.assertEqual(res["boost"], "AAA")
+                self.assertEqual(res["total_cost"], 70.0)
+                # 50+40+30+20+10 drivers + 25+15 constructors + 50 boost
+                self.assertEqual(res["expected_points"], 240.0)
+
+    def test_raises_when_no_feasible_team(self):
+        drivers = {f"D{i}": (30.0, 10.0) for i in range(6)}
+        constructors = {"XXX": (10.0, 5.0), "YYY": (10.0, 5.0)}
+        for name, kernel_patch in _kernels():
+            with self.subTest(kernel=name), kernel_patch:
+                with self.assertRaises(RuntimeError):
+                    compute_optimal(50.0, _data(drivers, constructors))
+
+    @unittest.skipIf(ft.np is None, "numpy not installed; only the Python kernel is selectable")
+    def test_kernels_agree_on_random_rosters(self):
+        # Distinct prices/points keep the optimum unique, so both kernels
+        # must land on the same team, not just the same score.
+        for seed in (1, 2, 3):
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                d_prices = [p / 10.0 for p in rng.sample(range(50, 300), 10)]
+                d_pts = [float(p) for p in rng.sample(range(5, 70), 10)]
+                c_prices = [p / 10.0 for p in rng.sample(range(50, 300), 4)]
+                c_pts = [float(p) for p in rng.sample(range(5, 40), 4)]
+                d_codes = [f"D{i:02d}" for i in range(10)]
+                c_codes = [f"C{i}" for i in range(4)]
+                budget = round(0.6 * (sum(d_prices) + sum(c_prices)), 1)
+
+                args = (budget, d_codes, d_prices, d_pts, c_codes, c_prices, c_pts)
+                best_py = ft._search_python(*args)
+                best_np = ft._search_numpy(*args)
+
+                self.assertIsNotNone(best_py)
+                self.assertIsNotNone(best_np)
+                self.assertAlmostEqual(best_py[0], best_np[0], places=6)  # points
+                self.assertAlmostEqual(best_py[1], best_np[1], places=6)  # cost
+                self.assertEqual(sorted(best_py[2]), sorted(best_np[2]))  # constructors
+                self.assertEqual(sorted(best_py[3]), sorted(best_np[3]))  # drivers
+                self.assertEqual(best_py[4], best_np[4])  # boost
+
+
+if __name__ == "__main__":
+    unittest.main()